@@ -10,21 +10,25 @@
  -Fix argparser code
 """
 from lxml import etree
-from decimal import Decimal
+from decimal import Decimal, ROUND_FLOOR
 import argparse
 import math
 import sys
 import re
 
 
+# drops the whitespace indenting the tags while parsing
+SAVEFILE_PARSER = etree.XMLParser(remove_blank_text=True, huge_tree=True)
+
+
 def load_savefile(filename):
-    # return xml.etree.ElementTree.parse(filename).getroot()
-    with open(filename) as f:
-        # tree = etree.fromstring(f)
-        s = f.read()
-    s = s.replace('\n', '').replace('\t', '')
-    tree = etree.fromstring(s)
-    return tree
+    tree = etree.parse(filename, SAVEFILE_PARSER)
+    return tree.getroot()
+
+
+# the things on the savefile's map
+THINGS_XPATH = etree.XPath('/savegame/game/maps/li/things')
+GRASS_DEFS = ('PlantGrass', 'PlantTallGrass')
 
 
 def find_grass_elements(root):
@@ -36,71 +40,66 @@ def find_grass_elements(root):
     :return: The list of found things.
     :rtype: list
     """
-    things = root.xpath('/savegame/game/maps/li/things')[0]
+    things = THINGS_XPATH(root)[0]
     elements = list()
     for each in things:
-        if each.get('Class') == 'Plant' and each[0].text in ['PlantGrass', 'PlantTallGrass']:
+        if each.get('Class') == 'Plant' and each[0].text in GRASS_DEFS:
             elements.append(each)
     return elements
 
 
-def set_grass_bits(element, bits, bit_index):
+def set_grass_bits(element, bits):
     """
-    Given a PlantGrass or PlantTallGrass element, encode
-    bits[bit_index:bit_index+70] in its various fields.
+    Given a PlantGrass or PlantTallGrass element, encode 70 bits in its
+    various fields.
     :param element: The element to conceal the data in.
     :type element: lxml.Element
-    :param bits: The string of raw bits used for the entire operation.
-    :type bits: str
-    :param bit_index: The starting index in bits to read from.
-    :type bit_index: int
-    :return: The final value of bit_index, which is either 50 or 70 higher
-    than what was passed to the function.
+    :param bits: The 70 bits to conceal, most significant bit first.
+    :type bits: int
+    :return: The number of bits actually stored, which is either 70, or 50 if
+    the element has no age.
     :rtype: int
     """
-    if len(bits[bit_index:]) < 70:
-        bits += '0' * int((math.ceil(len(bits[bit_index:]) / 70.0) * 70) - len(bits[bit_index:]))
+    # lxml walks the sibling list on every index, so index a list of the children
+    kids = list(element)
     # the id holds 18 bits of data (e.g., 'PlantGrass0256' = 256)
-    id = int(bits[bit_index:bit_index + 18], 2)
-    prefix = element[0].text  # either 'PlantGrass' or 'PlantTallGrass'
-    element[1].text = prefix + str(id)
-    bit_index += 18
+    id = bits >> 52
+    prefix = kids[0].text  # either 'PlantGrass' or 'PlantTallGrass'
+    kids[1].text = prefix + str(id)
     # health is an integer between 5 and 85, holding 6 bits of our data
-    health = int(bits[bit_index:bit_index + 6], 2) + 5
-    element[4].text = str(health)
-    bit_index += 6
+    health = ((bits >> 46) & 0x3F) + 5
+    kids[4].text = str(health)
     # we know growth can have at least 8 decimal digits in the fractional
     # part, so we're storing 26 bits in here
-    growth = Decimal(int(bits[bit_index:bit_index + 26], 2)) / Decimal(100000000)
-    element[5].text = str(growth)
-    bit_index += 26
+    growth = (bits >> 20) & 0x3FFFFFF
+    kids[5].text = '0.{:08d}'.format(growth)
     # we know age can go at least as high as 1,096,000, so we're storing 20 bits here
-    age = int(bits[bit_index:bit_index + 20], 2)
-    try:  # age isn't always present
-        element[6].text = str(age)
-        bit_index += 20
-    except:
-        # if not, no real loss
-        pass
-    return bit_index
+    age = bits & 0xFFFFF
+    if len(kids) > 6:  # age isn't always present
+        kids[6].text = str(age)
+        return 70
+    # if not, no real loss
+    return 50
 
 
-def bytes_to_grasses(elements, bytes):
+def bytes_to_grasses(elements, payload):
     """
-    Given a list of PlantGrass and PlantTallGrass elements and a string of
-    bits, encode the data in the elements.
+    Given a list of PlantGrass and PlantTallGrass elements and a list of
+    bytes, encode the data in the elements.
     :param elements: The list of elements to hide data in.
     :type elements: lxml.Element
-    :param bytes: The list of bytes to encode.
-    :type bits: list
+    :param payload: The list of bytes to encode.
+    :type payload: bytes
     :return: Nothing.
     """
-    # turn the list of bytes into a string of bits
-    bits = ''.join([bin(x)[2:].zfill(8) for x in bytes])
+    payload = bytes(payload)
     # calculate the size of data to store, this will be the first 22 bits of
     # encoded data, allowing for a maximum of 4 GB to be hidden per file.
-    payload_size = min((len(elements) * 70) - 22, len(bytes) * 8)
-    bits = bin(payload_size)[2:].zfill(22) + bits
+    payload_size = min((len(elements) * 70) - 22, len(payload) * 8)
+    # put the size in front of the payload, shifted so the two fill whole
+    # bytes, and zero pad the end so a full 70 bits can be read anywhere
+    bits = (payload_size << (len(payload) * 8)) | int.from_bytes(payload, 'big')
+    buffer = (bits << 2).to_bytes(len(payload) + 3, 'big') + bytes(10)
     # calculate capacity
     num_bits = payload_size + 22
     bit_index = 0
@@ -108,7 +107,12 @@ def bytes_to_grasses(elements, bytes):
         # don't store more data than intended
         if bit_index >= num_bits:
             break
-        bit_index = set_grass_bits(each, bits, bit_index)
+        # read the 10 bytes holding the next 70 bits, and shift off the bits
+        # that don't belong to this element
+        start = bit_index >> 3
+        window = int.from_bytes(buffer[start:start + 10], 'big')
+        window = (window >> (10 - (bit_index & 7))) & ((1 << 70) - 1)
+        bit_index += set_grass_bits(each, window)
     return None
 
 
@@ -120,29 +124,35 @@ def get_grass_bits(element):
     missing.
     :param element: The PlantGrass/PlantTallGrass element with hidden data.
     :type element: lxml.Element
-    :return: The raw bits that were hidden in the element.
-    :rtype: str
+    :return: The raw bits that were hidden in the element as an integer, and
+    how many bits that integer holds.
+    :rtype: tuple
     """
-    bits = str()
+    kids = list(element)
     # the numerical digits after the name conceal the 18 bits of data in id
     # example: PlantGrass0256 = 256
-    id = int(element[1].text[len(element[0].text):])
-    bits += bin(id)[2:].zfill(18)
+    # every field is masked to its width, so an element we didn't write can't
+    # spill into its neighbors
+    bits = int(kids[1].text[len(kids[0].text):]) & 0x3FFFF
     # the health is an integer from 5 to 85, we use 6 bits of it.
-    health = int(element[4].text) - 5
-    bits += bin(health)[2:].zfill(6)
+    health = (int(kids[4].text) - 5) & 0x3F
+    bits = (bits << 6) | health
     # we're assuming that we have 8 decimal digits in the fractional part of
-    # growth, giving us 26 bits
-    growth = Decimal(element[5].text) * Decimal(100000000)
-    bits += bin(int(growth))[2:].zfill(26)
+    # growth, giving us 26 bits. anything not written as '0.' plus 8 digits
+    # (e.g. '1.2E-7' or '0.1234567') is parsed as a Decimal instead
+    growth = kids[5].text
+    if len(growth) == 10 and growth.startswith('0.'):
+        growth = int(growth[2:])
+    else:
+        growth = int(Decimal(growth).scaleb(8))
+    bits = (bits << 26) | (growth & 0x3FFFFFF)
     # in a few rare cases, the age attribute doesn't exist
-    try:
+    if len(kids) > 6:
         # if it does, it holds 20 bits of information
-        age = int(element[6].text)
-        bits += bin(age)[2:].zfill(20)
-    except:
-        pass
-    return bits
+        age = int(kids[6].text) & 0xFFFFF
+        bits = (bits << 20) | age
+        return bits, 70
+    return bits, 50
 
 
 def bytes_from_grasses(elements):
@@ -151,34 +161,53 @@ def bytes_from_grasses(elements):
     We assume that the first 22 bits of encoded data is the size of the payload
     (excluding itself) in bits. This thus covers a maximum capacity of 4
     gigabytes per cover file.
+
+    The elements after the payload keep their cover values, which don't fit
+    the field widths, so payloads ending at any bit offset must round-trip:
+
+    >>> cover = ('<thing Class="Plant"><def>PlantGrass</def>'
+    ...          '<id>PlantGrass3381976</id><map>0</map><pos>(64, 0, 82)</pos>'
+    ...          '<health>1</health><growth>1</growth><age>916000</age></thing>')
+    >>> for size in [0, 4, 5, 6, 13, 14, 21, 22, 23, 30, 31, 32, 39, 40, 41,
+    ...              48, 49, 56, 57, 58]:
+    ...     grasses = list(etree.fromstring('<things>' + cover * 10 + '</things>'))
+    ...     payload = bytes(range(256 - size, 256))
+    ...     bytes_to_grasses(grasses, payload)
+    ...     assert bytes_from_grasses(grasses) == payload, size
+
     :param elements: The elements concealing the data.
     :type elements: list
     :return: The bytes of encoded data, with zero-padding.
-    :rtype: list
+    :rtype: bytes
     """
     # find out how many bits are stored in the elements
-    num_bits = int(get_grass_bits(elements[0])[:22], 2) + 22
-    # don't return the bits encoding the size, just the raw payload
-    bits = get_grass_bits(elements[0])[22:]
+    bits, num_read = get_grass_bits(elements[0])
+    num_read -= 22
+    num_bits = (bits >> num_read) + 22
+    # don't return the bits encoding the size, just the raw payload. each
+    # element's bits are kept as a binary string and parsed together at the end
+    chunks = [format(bits & ((1 << num_read) - 1), '0{}b'.format(num_read))]
     # decode the bits from all remaining elements, if necessary
+    payload_size = num_bits - 22
     index = 1
     while index < len(elements):
         # don't read more data than is encoded
-        if len(bits) >= num_bits:
+        if num_read >= payload_size:
             break
-        bits += get_grass_bits(elements[index])
+        element_bits, element_length = get_grass_bits(elements[index])
+        chunks.append(format(element_bits, '0{}b'.format(element_length)))
+        num_read += element_length
         index += 1
+    bits = int(''.join(chunks), 2)
+    # drop any bits past the end of the payload
+    if num_read > payload_size:
+        bits >>= num_read - payload_size
+    else:
+        bits <<= payload_size - num_read
     # zero pad so we can return bytes, not bits
-    bits = bits[:num_bits-22]
-    if len(bits) % 8 != 0:
-        bits += '0' * int(math.ceil(len(bits) / 8.0) - len(bits))
-    # convert bits to bytes
-    index = 0
-    bytes = list()
-    while index < len(bits):
-        bytes.append(int(bits[index:index+8],2))
-        index += 8
-    return bytes
+    padding = -payload_size % 8
+    bits <<= padding
+    return bits.to_bytes((payload_size + padding) // 8, 'big')
 
 
 def encode_in_grasses(cover_filename, payload_filename, result_filename):
@@ -202,9 +231,8 @@ def encode_in_grasses(cover_filename, payload_filename, result_filename):
     # encode the payload in the fields of the plant elements
     bytes_to_grasses(my_elements, payload)
 
-    # write the resulting file to disk
-    with open(result_filename, 'w') as f:
-        f.write(etree.tostring(root, pretty_print=True))
+    # write the resulting file to disk, streamed out by lxml
+    etree.ElementTree(root).write(result_filename, pretty_print=True, encoding='utf-8', xml_declaration=True)
 
 
 def decode_from_grasses(encoded_filename, result_filename):
@@ -220,11 +248,15 @@ def decode_from_grasses(encoded_filename, result_filename):
 
     # extract the encoded data
     my_elements = find_grass_elements(root)
-    bytes = bytes_from_grasses(my_elements)
+    my_bytes = bytes_from_grasses(my_elements)
 
     # write the results to disk
     with open(result_filename, 'wb') as f:
-        f.write(''.join([chr(x) for x in bytes]))
+        f.write(bytes(my_bytes))
+
+
+# the decimal strings float() accepts in a savefile, including exponents
+FLOAT_MATCH = re.compile(r'[-+]?\d+\.\d*(?:[eE][-+]?\d+)?\Z').match
 
 
 def find_floating_point_elements(root):
@@ -234,13 +266,10 @@ def find_floating_point_elements(root):
     :return:
     """
     my_floats = list()
-    for element in root.iter():
-        if len(element) == 0 and element.text is not None and element.text.find('.') > 0:
-            try:
-                x = float(element.text)
-                my_floats.append(element)
-            except:
-                continue
+    # only visit elements (not comments), and check the cheap conditions first
+    for element in root.iter(etree.Element):
+        if element.text and '.' in element.text and len(element) == 0 and FLOAT_MATCH(element.text):
+            my_floats.append(element)
     return my_floats
 
 
@@ -252,17 +281,26 @@ def recursive_children(e):
     return num_children
 
 
-def bytes_to_whitespace(bytes):
+# maps the digits of a binary string onto spaces (zeroes) and tabs (ones),
+# and back again
+BITS_TO_WHITESPACE = str.maketrans('01', ' \t')
+WHITESPACE_TO_BITS = str.maketrans(' \t', '01')
+
+
+def bytes_to_whitespace(payload):
     """
     Given a list of bytes, return a string of whitespace.
-    :param bytes: The bytes to encode in whitespace.
-    :type bytes: list
+    :param payload: The bytes to encode in whitespace.
+    :type payload: bytes
     :return: The whitespace string of spaces (zeroes) and tabs (ones).
     :rtype: str
     """
-    whitespace = ''.join([bin(x)[2:].zfill(8) for x in bytes])
-    whitespace = whitespace.replace('0', ' ').replace('1', '\t')
-    return whitespace
+    payload = bytes(payload)
+    if len(payload) == 0:
+        return ''
+    # format the payload as one big integer, zero-padded to 8 bits per byte
+    bits = format(int.from_bytes(payload, 'big'), '0{}b'.format(len(payload) * 8))
+    return bits.translate(BITS_TO_WHITESPACE)
 
 
 def whitespace_to_bytes(whitespace):
@@ -270,22 +308,18 @@ def whitespace_to_bytes(whitespace):
     Given a string of whitespace, return the encoded binary message.
     :param whitespace: A series of spaces and tabs, representing zeroes and ones.
     :type whitespace: str
-    :return: The encoded bytes as a list of ints (bytes).
-    :rtype: list
+    :return: The encoded bytes.
+    :rtype: bytes
     """
     # convert spaces to 0 and tabs to 1
-    message = whitespace.replace(' ', '0').replace('\t', '1')
+    message = whitespace.translate(WHITESPACE_TO_BITS)
     # add padding to the end, if necessary
     if len(message) % 8 != 0:
         message += '0' * (8 - (len(message) % 8))
-    # convert to bytes
-    my_bytes = list()
-    index = 0
-    while index  < len(message):
-        # read one byte at a time
-        my_bytes.append(int(message[index:index+8], 2))
-        index += 8
-    return my_bytes
+    if len(message) == 0:
+        return bytes()
+    # parse the whole message as one binary number
+    return int(message, 2).to_bytes(len(message) // 8, 'big')
 
 
 def intersperse_whitespace(cover_list, whitespace):
@@ -298,18 +332,22 @@ def intersperse_whitespace(cover_list, whitespace):
     :return: The string of encoded text
     :rtype: str
     """
-    results = str()
+    # collect the pieces and join them at the end
+    results = list()
     index = 0
-    cover_list = etree.tostring(etree.fromstring(''.join(cover_list)), pretty_print=True).split('\n')
+    # each tag goes on its own line, followed by one character of whitespace
     minimum = min(len(cover_list), len(whitespace))
     while index < minimum:
-        results += cover_list[index] + whitespace[index] + '\n\r'
+        results.append(cover_list[index])
+        results.append(whitespace[index])
+        results.append('\n\r')
         index += 1
     if len(cover_list) > len(whitespace):
-        results += '\n\r'.join(cover_list[index:]) + '\n\r'
+        results.append('\n\r'.join(cover_list[index:]))
+        results.append('\n\r')
     else:
-        results += whitespace[index:]
-    return results
+        results.append(whitespace[index:])
+    return ''.join(results)
 
 
 def extract_whitespace(encoded_text):
@@ -347,17 +385,32 @@ def extract_whitespace(encoded_text):
     return ''.join(whitespace)
 
 
+# the boundaries between adjacent tags, along with the newlines and tabs that
+# indent them
+TAG_SPLIT = re.compile(r'>[\r\n\t]*<').split
+
+
 def extract_tags(text):
     """
     Given a string of xml, return a list of tokens, with surrounding whitespace removed.
+    Nothing else is dropped, so joining the tokens gives back the text minus
+    the whitespace between tags.
+
+    >>> extract_tags('<a>\\n\\t<label>a > b</label>\\n</a>\\n')
+    ['<a>', '<label>a > b</label>', '</a>']
+    >>> extract_tags('<r>mixed<b>x</b>tail</r>')
+    ['<r>mixed<b>x</b>tail</r>']
+    >>> ''.join(extract_tags('\\ufeff<a b="x>y">t</a>\\n\\t<r> </r>\\n'))
+    '\\ufeff<a b="x>y">t</a><r> </r>'
+
     :param text: The string of valid xml.
     :type text: str
     :return: The list of xml tokens.
     :rtype: list
     """
-    # split the string wherever tags immediately follow each other to ensure we strings like
+    # split the string wherever tags follow each other to ensure strings like
     # "<gameversion>0.18.1722 rev1198</gameversion>" are kept together
-    tokens = text.split('><')
+    tokens = TAG_SPLIT(text.strip())
     tokens = ['<' + x + '>' for x in tokens]
     tokens[0] = tokens[0][1:]
     tokens[-1] = tokens[-1][:-1]
@@ -366,18 +419,15 @@ def extract_tags(text):
 
 def get_bytes_from_file(filename):
     """
-    Load the raw bytes of a file as a string of ints.
+    Load the raw bytes of a file. Indexing or iterating over the result
+    yields ints, so it can be used anywhere a list of bytes is expected.
     :param filename: The filename to load from.
     :type filename: str
-    :return: The list of bytes (ints).
-    :rtype: list
+    :return: The raw bytes of the file.
+    :rtype: bytes
     """
-    payload = list()
     with open(filename, 'rb') as f:
-        byte = f.read(1)
-        while byte != '':
-            payload.append(ord(byte))
-            byte = f.read(1)
+        payload = f.read()
     return payload
 
 
@@ -392,9 +442,9 @@ def encode(cover_filename, payload_filename, result_filename):
     :param result_filename: The filename to use for the resulting file.
     :type result_filename: str
     """
-    # get our cover file, remove whitespace from it
+    # get our cover file, split it into tags
     with open(cover_filename, 'r') as f:
-        tokens = extract_tags(f.read().replace('\n', '').replace('\r', '').replace('\t', ''))
+        tokens = extract_tags(f.read())
 
     # get the raw bytes of our payload
     payload = get_bytes_from_file(payload_filename)
@@ -403,8 +453,8 @@ def encode(cover_filename, payload_filename, result_filename):
     whitespace = bytes_to_whitespace(payload)
     encoded_text = intersperse_whitespace(tokens, whitespace)
 
-    # write the resulting file to disk
-    with open(result_filename, 'w') as f:
+    # write the resulting file to disk, without translating our line endings
+    with open(result_filename, 'w', newline='') as f:
         f.write(encoded_text)
 
 
@@ -417,16 +467,17 @@ def decode(encoded_filename, result_filename):
     :param result_filename: The filename to write the extracted data to.
     :type result_filename: str
     """
-    with open(encoded_filename, 'r') as f:
+    # keep the line endings as they are, so '\n\r' isn't translated to '\n\n'
+    with open(encoded_filename, 'r', newline='') as f:
         # remove irrelevant whitespace
         whitespace = extract_whitespace(f.read())
 
     # extract the encoded data
-    bytes = whitespace_to_bytes(whitespace)
+    my_bytes = whitespace_to_bytes(whitespace)
 
     # write the results to disk
     with open(result_filename, 'wb') as f:
-        f.write(''.join([chr(x) for x in bytes]))
+        f.write(bytes(my_bytes))
 
 
 def bytes_to_floats(floats, payload):
@@ -437,21 +488,36 @@ def bytes_to_floats(floats, payload):
     :param floats: The list of lxml Elements to modify.
     :type floats: list
     :param payload: The list of bytes to conceal.
-    :type payload: list
+    :type payload: bytes
     """
     # calculate the number of bytes to store
     num_bytes = len(payload)
     # only store as much data as we have room for
     if num_bytes + 4 > len(floats): # TODO - Implement more aggressive mode, two bytes in fraction and two bytes in whole number
         num_bytes = len(floats) - 4
-    bytes = list()
     # the first four concealed bytes are the number of stored bytes (not counting these four)
-    for i in range(4):
-        bytes.append(float((num_bytes >> ((3 - i) * 8)) & 255) * 0.001)
-    bytes += [float(x) * 0.001 for x in payload]
-    # store the bytes as the decimal fractions of the first num_bytes floats
-    for index in range(num_bytes + 4):
-        floats[index].text = str(bytes[index] + math.floor(float(floats[index].text)))
+    my_bytes = num_bytes.to_bytes(4, 'big') + bytes(payload[:num_bytes])
+    # store the bytes as the decimal fractions of the first num_bytes floats,
+    # counting in whole thousandths so there's no floating-point rounding
+    for element, byte in zip(floats, my_bytes):
+        thousandths = math.floor(float(element.text)) * 1000 + byte
+        sign = '-' if thousandths < 0 else ''
+        element.text = '{}{}.{:03d}'.format(sign, *divmod(abs(thousandths), 1000))
+
+
+def fraction_to_byte(text):
+    """
+    Given the text of a floating-point value, return the byte stored in the
+    first three digits of its decimal fraction.
+    :param text: The floating-point value, e.g. '-1.877'.
+    :type text: str
+    :return: The concealed byte, e.g. 123.
+    :rtype: int
+    """
+    # floor rather than truncate, so negative values give the fraction above
+    # the whole part
+    value = Decimal(text)
+    return int((value - value.to_integral_value(rounding=ROUND_FLOOR)) * 1000)
 
 
 def floats_to_bytes(floats, num_bytes=None):
@@ -467,16 +533,16 @@ def floats_to_bytes(floats, num_bytes=None):
     :return: The list of bytes retrieved from the Elements.
     :rtype: list
     """
-    bytes = list()
+    my_bytes = list()
     if num_bytes is None:
         num_bytes = 0
         for index in range(4):
-            bytes.append((int((Decimal(floats[index].text) - Decimal(math.floor(Decimal(floats[index].text)))) * 1000)))
+            my_bytes.append(fraction_to_byte(floats[index].text))
         for i in range(4):
-            num_bytes += bytes[i] * (2 ** (8 * (3 - i)))
+            num_bytes += my_bytes[i] * (2 ** (8 * (3 - i)))
     for index in range(4, num_bytes+4):
-        bytes.append((int((Decimal(floats[index].text) - Decimal(math.floor(Decimal(floats[index].text)))) * 1000)))
-    return bytes
+        my_bytes.append(fraction_to_byte(floats[index].text))
+    return my_bytes
 
 
 def encode_in_floating_point(cover_filename, payload_filename, result_filename):
@@ -500,9 +566,8 @@ def encode_in_floating_point(cover_filename, payload_filename, result_filename):
     # encode the payload as floating-point numbers
     bytes_to_floats(my_floats, payload)
 
-    # write the resulting file to disk
-    with open(result_filename, 'w') as f:
-        f.write(etree.tostring(root, pretty_print=True))
+    # write the resulting file to disk, streamed out by lxml
+    etree.ElementTree(root).write(result_filename, pretty_print=True, encoding='utf-8', xml_declaration=True)
 
 
 def decode_from_floating_point(encoded_filename, result_filename):
@@ -518,11 +583,11 @@ def decode_from_floating_point(encoded_filename, result_filename):
 
     # extract the encoded data
     my_floats = find_floating_point_elements(root)
-    bytes = floats_to_bytes(my_floats)[4:]
+    my_bytes = floats_to_bytes(my_floats)[4:]
 
     # write the results to disk
     with open(result_filename, 'wb') as f:
-        f.write(''.join([chr(x) for x in bytes]))
+        f.write(bytes(my_bytes))
 
 
 def main():